@@ -3,12 +3,13 @@ from typing import Any
 import aiohttp
 import asyncio
 import base64
-import json
+import dataclasses
 import logging
+import orjson
+import re
+import time
 import urllib.parse
 
-from tenacity import before_sleep_log, retry, retry_if_exception_type, stop_after_attempt, wait_fixed
-
 from .exceptions import (
     AOSmithEnergyUsageDataUnavailableException,
     AOSmithInvalidCredentialsException,
@@ -27,9 +28,17 @@ from .models import (
 )
 from .queries import (
     ALL_DEVICE_DATA_GRAPHQL_QUERY,
+    ALL_DEVICE_DATA_NO_ALERTS_GRAPHQL_QUERY,
+    BATCHED_ENERGY_USE_DATA_QUERY_PREFIX,
     DEVICES_BASIC_INFO_GRAPHQL_QUERY,
     DEVICES_GRAPHQL_QUERY,
-    ENERGY_USE_DATA_GRAPHQL_QUERY
+    DEVICES_STATE_GRAPHQL_QUERY,
+    ENERGY_USE_DATA_GRAPHQL_QUERY,
+    LOGIN_GRAPHQL_QUERY,
+    STATUS_GRAPHQL_QUERY,
+    UPDATE_MODE_GRAPHQL_MUTATION,
+    UPDATE_SETPOINT_GRAPHQL_MUTATION,
+    build_batched_energy_use_data_graphql_query
 )
 
 API_BASE_URL = "https://r2.wh8.co"
@@ -38,36 +47,87 @@ USER_AGENT = "okhttp/4.9.2"
 
 MAX_RETRIES = 2
 
+QUERY_RETRY_ATTEMPTS = 6
+QUERY_RETRY_WAIT_SECONDS = 10
+
+# How long a cached device list stays fresh, in seconds
+DEVICES_CACHE_TTL = 5.0
+
+# Upper bound on concurrent outbound requests, to stay clear of server-side throttling
+DEFAULT_MAX_CONCURRENT_REQUESTS = 5
+
 TIMEOUT = aiohttp.ClientTimeout(total=20)
 
+BASE_HEADERS = {
+    "brand": "aosmith",
+    "version": APP_VERSION,
+    "User-Agent": USER_AGENT,
+    "Content-Type": "application/json"
+}
+
 logger = logging.getLogger(__name__)
 
+# The devices queries only ever take these variable payloads, so share one dict per shape
+# instead of allocating a fresh one per call
+FORCE_UPDATE_VARIABLES = {"forceUpdate": True}
+NO_FORCE_UPDATE_VARIABLES = {"forceUpdate": False}
+EMPTY_VARIABLES: dict[str, Any] = {}
+
+# Pre-encoded request body templates, keyed by query string - the query text only has to be JSON-escaped once
+REQUEST_BODY_TEMPLATES: dict[str, bytes] = {}
+
+OPERATION_NAME_RE = re.compile(r"^(?:query|mutation)\s+(\w+)")
+
+def build_graphql_request_body(query: str, variables: dict[str, Any]) -> bytes:
+    template = REQUEST_BODY_TEMPLATES.get(query)
+    if template is None:
+        # Sending the operation name lets the server key its query-plan cache by name
+        # instead of hashing the full query text
+        operation_name_match = OPERATION_NAME_RE.match(query)
+        if operation_name_match is not None:
+            template = b'{"operationName":' + orjson.dumps(operation_name_match.group(1)) + b',"query":' + orjson.dumps(query) + b',"variables":%s}'
+        else:
+            template = b'{"query":' + orjson.dumps(query) + b',"variables":%s}'
+        REQUEST_BODY_TEMPLATES[query] = template
+
+    return template % orjson.dumps(variables)
+
 def build_passcode(email: str, password: str) -> str:
-    data = {'email': email, 'password': password}
-    json_string = json.dumps(data)
-    url_encoded = urllib.parse.quote(json_string)
-    base64_encoded = base64.b64encode(url_encoded.encode()).decode('utf-8')
-    return base64_encoded
+    payload = orjson.dumps({'email': email, 'password': password})
+    url_encoded = urllib.parse.quote_from_bytes(payload).encode('ascii')
+    return base64.b64encode(url_encoded).decode('ascii')
 
-def device_is_compatible(device_dict: dict[str, Any]) -> bool:
-    device_type = device_dict.get("data", {}).get("__typename")
-    if device_type is None:
-        return False
+# Device types this library knows how to map, precomputed once at import
+DEVICE_TYPE_STR_TO_DEVICE_TYPE = {
+    "NextGenHeatPump": DeviceType.NEXT_GEN_HEAT_PUMP,
+    "RE3Connected": DeviceType.RE3_CONNECTED
+}
 
-    return device_type in ["NextGenHeatPump", "RE3Connected"]
+def device_is_compatible(device_dict: dict[str, Any]) -> bool:
+    data = device_dict.get("data")
+    return data is not None and data.get("__typename") in DEVICE_TYPE_STR_TO_DEVICE_TYPE
+
+# Used to distinguish a missing device key from a missing key inside the data dict when mapping fails
+DEVICE_REQUIRED_DATA_KEYS = frozenset(("temperatureSetpoint", "temperatureSetpointPending", "temperatureSetpointPrevious", "temperatureSetpointMaximum", "modes", "isOnline", "firmwareVersion", "hotWaterStatus", "mode", "modePending"))
+
+MODE_STR_TO_OPERATION_MODE = {
+    "HYBRID": OperationMode.HYBRID,
+    "HEAT_PUMP": OperationMode.HEAT_PUMP,
+    "ELECTRIC": OperationMode.ELECTRIC,
+    "VACATION": OperationMode.VACATION,
+    "STANDARD": OperationMode.ELECTRIC
+}
+
+HOT_WATER_STATUS_STR_TO_INT = {
+    "LOW": 0,
+    "MEDIUM": 50,
+    "HIGH": 100
+}
 
 def map_mode_str_to_operation_mode_type(mode_str: str) -> OperationMode:
-    if mode_str == "HYBRID":
-        return OperationMode.HYBRID
-    elif mode_str == "HEAT_PUMP":
-        return OperationMode.HEAT_PUMP
-    elif mode_str == "ELECTRIC":
-        return OperationMode.ELECTRIC
-    elif mode_str == "VACATION":
-        return OperationMode.VACATION
-    elif mode_str == "STANDARD":
-        return OperationMode.ELECTRIC
-    else:
+    try:
+        return MODE_STR_TO_OPERATION_MODE[mode_str]
+    except KeyError:
         raise AOSmithUnknownException("Unknown mode")
 
 def map_mode_dict_to_operation_mode(mode_dict: dict[str, Any]) -> SupportedOperationModeInfo:
@@ -93,181 +153,258 @@ def parse_hot_water_status(hot_water_status: int | str | None) -> int | None:
     if hot_water_status is None:
         return None
     elif isinstance(hot_water_status, str):
-        hot_water_status_str_upper = hot_water_status.upper()
-        if hot_water_status_str_upper == "LOW":
-            return 0
-        elif hot_water_status_str_upper == "MEDIUM":
-            return 50
-        elif hot_water_status_str_upper == "HIGH":
-            return 100
+        parsed = HOT_WATER_STATUS_STR_TO_INT.get(hot_water_status.upper())
+        if parsed is not None:
+            return parsed
     elif isinstance(hot_water_status, int):
         # The value returned by the API increases as the hot water is used, so we need to normalize it
         return 100 - hot_water_status
 
     raise AOSmithUnknownException("Unknown hot water status")
 
+def map_device_data_to_device_status(data: dict[str, Any]) -> DeviceStatus:
+    # Indexes the keys directly - callers wrap this in try/except to report anything missing
+    return DeviceStatus(
+        firmware_version=data["firmwareVersion"],
+        is_online=data["isOnline"],
+        current_mode=map_mode_str_to_operation_mode_type(data["mode"]),
+        mode_change_pending=data["modePending"],
+        temperature_setpoint=data["temperatureSetpoint"],
+        temperature_setpoint_pending=data["temperatureSetpointPending"],
+        temperature_setpoint_previous=data["temperatureSetpointPrevious"],
+        temperature_setpoint_maximum=data["temperatureSetpointMaximum"],
+        hot_water_status=parse_hot_water_status(data["hotWaterStatus"]),
+    )
+
 def map_device_dict_to_device(device_dict: dict[str, Any]) -> Device:
-    device_type_str = device_dict.get("data", {}).get("__typename")
+    data = device_dict.get("data")
+    if data is None:
+        raise AOSmithUnknownException("Missing required keys")
+
+    device_type_str = data.get("__typename")
     if device_type_str is None:
         raise AOSmithUnknownException("Failed to determine device type")
 
-    if device_type_str == "NextGenHeatPump":
-        device_type = DeviceType.NEXT_GEN_HEAT_PUMP
-    elif device_type_str == "RE3Connected":
-        device_type = DeviceType.RE3_CONNECTED
-    else:
+    device_type = DEVICE_TYPE_STR_TO_DEVICE_TYPE.get(device_type_str)
+    if device_type is None:
         raise AOSmithUnknownException("Unknown device type")
 
-    required_keys = ["brand", "model", "dsn", "junctionId", "name", "serial", "install", "data"]
-    if not all(key in device_dict for key in required_keys):
-        raise AOSmithUnknownException("Missing required keys")
-
-    required_data_keys = ["temperatureSetpoint", "temperatureSetpointPending", "temperatureSetpointPrevious", "temperatureSetpointMaximum", "modes", "isOnline", "firmwareVersion", "hotWaterStatus", "mode", "modePending"]
-    if not all(key in device_dict["data"] for key in required_data_keys):
-        raise AOSmithUnknownException("Missing required data keys")
-
-    return Device(
-        brand=device_dict["brand"],
-        model=device_dict["model"],
-        device_type=device_type,
-        dsn=device_dict["dsn"],
-        junction_id=device_dict["junctionId"],
-        name=device_dict["name"],
-        serial=device_dict["serial"],
-        install_location=device_dict["install"]["location"],
-        supported_modes=list(map(map_mode_dict_to_operation_mode, device_dict["data"]["modes"])),
-        status=DeviceStatus(
-            firmware_version=device_dict["data"]["firmwareVersion"],
-            is_online=device_dict["data"]["isOnline"],
-            current_mode=map_mode_str_to_operation_mode_type(device_dict["data"]["mode"]),
-            mode_change_pending=device_dict["data"]["modePending"],
-            temperature_setpoint=device_dict["data"]["temperatureSetpoint"],
-            temperature_setpoint_pending=device_dict["data"]["temperatureSetpointPending"],
-            temperature_setpoint_previous=device_dict["data"]["temperatureSetpointPrevious"],
-            temperature_setpoint_maximum=device_dict["data"]["temperatureSetpointMaximum"],
-            hot_water_status=parse_hot_water_status(device_dict["data"]["hotWaterStatus"]),
+    # Index the keys directly and let the handler below report anything missing,
+    # so the happy path doesn't pay for a separate validation pass
+    try:
+        return Device(
+            brand=device_dict["brand"],
+            model=device_dict["model"],
+            device_type=device_type,
+            dsn=device_dict["dsn"],
+            junction_id=device_dict["junctionId"],
+            name=device_dict["name"],
+            serial=device_dict["serial"],
+            install_location=device_dict["install"]["location"],
+            supported_modes=[map_mode_dict_to_operation_mode(mode_dict) for mode_dict in data["modes"]],
+            status=map_device_data_to_device_status(data)
         )
-    )
+    except KeyError as err:
+        if err.args and err.args[0] in DEVICE_REQUIRED_DATA_KEYS:
+            raise AOSmithUnknownException("Missing required data keys") from err
+        raise AOSmithUnknownException("Missing required keys") from err
+    except TypeError as err:
+        raise AOSmithUnknownException("Missing required keys") from err
 
 def map_device_basic_info_dict_to_device_basic_info(device_basic_info_dict: dict[str, Any]) -> DeviceBasicInfo:
-    required_keys = ["brand", "model", "deviceType", "dsn", "junctionId", "name", "serial"]
-    if not all(key in device_basic_info_dict for key in required_keys):
-        raise AOSmithUnknownException("Missing required keys")
-
-    return DeviceBasicInfo(
-        brand=device_basic_info_dict["brand"],
-        model=device_basic_info_dict["model"],
-        device_type=device_basic_info_dict["deviceType"],
-        dsn=device_basic_info_dict["dsn"],
-        junction_id=device_basic_info_dict["junctionId"],
-        name=device_basic_info_dict["name"],
-        serial=device_basic_info_dict["serial"]
-    )
-
-def map_energy_use_history_entry_dict_to_energy_use_history_entry(energy_use_history_entry_dict: dict[str, Any]) -> EnergyUseHistoryEntry:
-    required_keys = ["date", "kwh"]
-    if not all(key in energy_use_history_entry_dict for key in required_keys):
-        raise AOSmithUnknownException("Missing required keys")
-
-    return EnergyUseHistoryEntry(
-        date=energy_use_history_entry_dict["date"],
-        energy_use_kwh=energy_use_history_entry_dict["kwh"]
-    )
+    try:
+        return DeviceBasicInfo(
+            brand=device_basic_info_dict["brand"],
+            model=device_basic_info_dict["model"],
+            device_type=device_basic_info_dict["deviceType"],
+            dsn=device_basic_info_dict["dsn"],
+            junction_id=device_basic_info_dict["junctionId"],
+            name=device_basic_info_dict["name"],
+            serial=device_basic_info_dict["serial"]
+        )
+    except KeyError as err:
+        raise AOSmithUnknownException("Missing required keys") from err
 
 def map_energy_use_data_dict_to_energy_use_data(energy_use_data_dict: dict[str, Any]) -> EnergyUseData:
-    required_keys = ["graphData", "lifetimeKwh"]
-    if not all(key in energy_use_data_dict for key in required_keys):
+    graph_data = energy_use_data_dict.get("graphData")
+    if not isinstance(graph_data, list):
         raise AOSmithUnknownException("Missing required keys")
 
-    return EnergyUseData(
-        lifetime_kwh=energy_use_data_dict["lifetimeKwh"],
-        history=list(map(map_energy_use_history_entry_dict_to_energy_use_history_entry, energy_use_data_dict["graphData"]))
-    )
+    # The history can hold years of daily entries, so build it in one pass without a per-entry mapper call
+    try:
+        return EnergyUseData(
+            lifetime_kwh=energy_use_data_dict["lifetimeKwh"],
+            history=[
+                EnergyUseHistoryEntry(date=entry_dict["date"], energy_use_kwh=entry_dict["kwh"])
+                for entry_dict in graph_data
+            ]
+        )
+    except KeyError as err:
+        raise AOSmithUnknownException("Missing required keys") from err
 
 class AOSmithAPIClient:
     token: str = None
 
-    def __init__(self, email: str, password: str, session: aiohttp.ClientSession = None):
+    def __init__(
+        self,
+        email: str,
+        password: str,
+        session: aiohttp.ClientSession = None,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS
+    ):
         self.email = email
         self.password = password
-
+        # Credentials don't change after construction, so the passcode only has to be built once
+        self.__passcode = build_passcode(email, password)
+        self.__devices_cache: tuple[float, dict[str, Device]] | None = None
+        # dsn and deviceType are stable identifiers, so this cache never expires
+        self.__device_basic_info_cache: dict[str, DeviceBasicInfo] = {}
+        # Static device metadata from the last full fetch, so routine polls can use the slim
+        # state-only query
+        self.__device_metadata_cache: dict[str, Device] = {}
+        self.__login_lock = asyncio.Lock()
+        self.__token_issued_at: float | None = None
+        # Authenticated headers are rebuilt only when the token changes, not per request
+        self.__auth_headers: dict[str, str] | None = None
+        # Concurrent identical read queries share one in-flight request
+        self.__inflight_queries: dict[tuple[str, bytes], asyncio.Task] = {}
+        # Once the batched energy use query fails, stick to the per-device path
+        self.__energy_use_batching_failed = False
+        # Bound fan-out (e.g. the per-device energy use fallback) so it can't trip rate limits
+        self.__request_semaphore = asyncio.Semaphore(max_concurrent_requests)
+
+        self.__owns_session = session is None
         if session is None:
-            self.session = aiohttp.ClientSession()
+            # Size the connection pool for concurrent batched queries, keep connections alive
+            # between polls, and cache DNS lookups for the API host
+            connector = aiohttp.TCPConnector(limit=16, limit_per_host=8, keepalive_timeout=30, ttl_dns_cache=300)
+            self.session = aiohttp.ClientSession(connector=connector, timeout=TIMEOUT)
         else:
             self.session = session
 
-    @retry(
-        retry=retry_if_exception_type(AOSmithUnknownException),
-        reraise=True,
-        wait=wait_fixed(10),
-        stop=stop_after_attempt(6),
-        before_sleep=before_sleep_log(logger, logging.DEBUG)
-    )
     async def __send_graphql_query(
         self,
         query: str,
         variables: dict[str, Any],
         login_required: bool,
-        retrying_after_login: bool = False
+        retries: bool = True
     ) -> dict[str, Any]:
-        query_log = query.replace('\n', ' ')
-        logger.debug(f"Sending query, variables: {variables}, login_required: {login_required}, retrying_after_login: {retrying_after_login}, query: {query_log}")
+        # Mutations and login must each reach the server, but concurrent identical reads
+        # can share one outbound request
+        if query.startswith("mutation") or query == LOGIN_GRAPHQL_QUERY:
+            return await self.__send_graphql_query_with_retries(query, variables, login_required, retries)
+
+        key = (query, orjson.dumps(variables, option=orjson.OPT_SORT_KEYS))
+        task = self.__inflight_queries.get(key)
+        if task is not None:
+            return await task
+
+        task = asyncio.ensure_future(self.__send_graphql_query_with_retries(query, variables, login_required, retries))
+        self.__inflight_queries[key] = task
+        try:
+            return await task
+        finally:
+            self.__inflight_queries.pop(key, None)
 
-        headers = {
-            "brand": "aosmith",
-            "version": APP_VERSION,
-            "User-Agent": USER_AGENT
-        }
+    async def __send_graphql_query_with_retries(
+        self,
+        query: str,
+        variables: dict[str, Any],
+        login_required: bool,
+        retries: bool = True
+    ) -> dict[str, Any]:
+        # Retry unknown failures inline - invalid credentials and parameter errors are not retried
+        attempts = QUERY_RETRY_ATTEMPTS if retries else 1
+        for attempt in range(attempts):
+            try:
+                return await self.__send_graphql_query_once(query, variables, login_required)
+            except AOSmithUnknownException:
+                if attempt == attempts - 1:
+                    raise
+                logger.debug("Query failed - retrying in %s seconds", QUERY_RETRY_WAIT_SECONDS, exc_info=True)
+                await asyncio.sleep(QUERY_RETRY_WAIT_SECONDS)
+
+    async def __send_graphql_query_once(
+        self,
+        query: str,
+        variables: dict[str, Any],
+        login_required: bool
+    ) -> dict[str, Any]:
+        debug_logging_enabled = logger.isEnabledFor(logging.DEBUG)
+
+        request_body = build_graphql_request_body(query, variables)
+
+        # On a 401 the second pass re-issues the request once after a fresh login
+        for retrying_after_login in (False, True):
+            if debug_logging_enabled:
+                logger.debug(
+                    "Sending query, variables: %s, login_required: %s, retrying_after_login: %s, query: %s",
+                    variables,
+                    login_required,
+                    retrying_after_login,
+                    query
+                )
 
-        if login_required:
-            if self.token is None:
-                await self.__login()
+            if login_required:
                 if self.token is None:
-                    raise AOSmithUnknownException("Login failed")
-                logger.debug("Successfully logged in")
+                    await self.__login()
+                    if self.token is None:
+                        raise AOSmithUnknownException("Login failed")
+                    logger.debug("Successfully logged in")
 
-            headers["authorization"] = f"Bearer {self.token}"
+                headers = self.__auth_headers
+            else:
+                headers = BASE_HEADERS
 
-        try:
-            response = await self.session.request(
-                method="POST",
-                url=API_BASE_URL + "/graphql",
-                headers=headers,
-                json={
-                    "query": query,
-                    "variables": variables
-                },
-                timeout=TIMEOUT
-            )
-            logger.debug(f"Received response, status code: {response.status}")
-            logger.debug(f"Response body: {await response.text()}")
-        except asyncio.TimeoutError:
-            raise AOSmithUnknownException("Request timed out")
-        except Exception as err:
-            logger.exception("Request failed", exc_info=err)
-            raise AOSmithUnknownException("Request failed")
-
-        if response.status == 401:
-            if retrying_after_login:
-                raise AOSmithUnknownException("Received status code 401 after logging in")
-            logger.debug("Access token may be expired - trying to log in again")
-            await self.__login()
-            return await self.__send_graphql_query(query, variables, login_required, retrying_after_login=True)
-        elif response.status != 200:
-            raise AOSmithUnknownException(f"Received status code {response.status}")
-
-        response_json = await response.json()
+            try:
+                async with self.__request_semaphore:
+                    response = await self.session.request(
+                        method="POST",
+                        url=API_BASE_URL + "/graphql",
+                        headers=headers,
+                        data=request_body,
+                        timeout=TIMEOUT
+                    )
+                    response_body = await response.read()
+                if debug_logging_enabled:
+                    logger.debug("Received response, status code: %s", response.status)
+                    # Bound the logged body so huge energy history payloads don't blow up the log line
+                    logger.debug("Response body: %s", response_body[:4096].decode("utf-8", "replace"))
+            except asyncio.TimeoutError:
+                raise AOSmithUnknownException("Request timed out")
+            except Exception as err:
+                logger.exception("Request failed", exc_info=err)
+                raise AOSmithUnknownException("Request failed")
+
+            # Single comparison on the success path - the rare statuses bear their own cost
+            if response.status != 200:
+                # Only authenticated requests can recover from a 401 by logging in again - the
+                # login request itself must not re-enter __login, which is holding the login lock
+                if response.status == 401 and login_required:
+                    if retrying_after_login:
+                        raise AOSmithUnknownException("Received status code 401 after logging in")
+                    logger.debug("Access token may be expired - trying to log in again")
+                    await self.__login()
+                    continue
+
+                raise AOSmithUnknownException(f"Received status code {response.status}")
+
+            break
+
+        response_json = orjson.loads(response_body)
 
         if "errors" in response_json:
-            errors = response_json.get("errors")
-            if any(error.get("extensions", {}).get("code") == "INVALID_CREDENTIALS" for error in errors):
+            errors = response_json["errors"]
+            if any((error.get("extensions") or {}).get("code") == "INVALID_CREDENTIALS" for error in errors):
                 raise AOSmithInvalidCredentialsException("Invalid email address or password")
-            elif query == ENERGY_USE_DATA_GRAPHQL_QUERY and any(error.get("message", "") == "No data to display at this time." for error in errors):
+            elif (
+                query == ENERGY_USE_DATA_GRAPHQL_QUERY or query.startswith(BATCHED_ENERGY_USE_DATA_QUERY_PREFIX)
+            ) and any(error.get("message") == "No data to display at this time." for error in errors):
                 raise AOSmithEnergyUsageDataUnavailableException("Energy usage data is unavailable")
             else:
-                messages = ", ".join([error.get("message", "") for error in errors])
+                messages = ", ".join(filter(None, (error.get("message") for error in errors)))
                 raise AOSmithUnknownException("Error: " + messages)
-        elif query == DEVICES_GRAPHQL_QUERY:
+        elif query == DEVICES_GRAPHQL_QUERY or query == DEVICES_STATE_GRAPHQL_QUERY:
             device_dicts: list[dict[str, Any]] = response_json.get("data", {}).get("devices", [])
             for device_dict in device_dicts:
                 if device_dict.get("data", {}).get("isOnline") is None:
@@ -276,53 +413,137 @@ class AOSmithAPIClient:
         return response_json
 
     async def __login(self) -> None:
-        passcode = build_passcode(self.email, self.password)
+        token_issued_at_before = self.__token_issued_at
 
-        response = await self.__send_graphql_query(
-            "query login($passcode: String) { login(passcode: $passcode) { user { tokens { accessToken idToken refreshToken } } } }",
-            {
-                "passcode": passcode
-            },
-            False
-        )
+        async with self.__login_lock:
+            # Another task may have logged in while we waited for the lock - reuse its token
+            if self.token is not None and self.__token_issued_at != token_issued_at_before:
+                return
 
-        self.token = response.get("data", {}).get("login", {}).get("user", {}).get("tokens", {}).get("accessToken")
+            response = await self.__send_graphql_query(
+                LOGIN_GRAPHQL_QUERY,
+                {
+                    "passcode": self.__passcode
+                },
+                False
+            )
+
+            # Index the path directly - the chained .get calls allocated an empty dict per level on failure
+            try:
+                self.token = response["data"]["login"]["user"]["tokens"]["accessToken"]
+            except (KeyError, TypeError):
+                self.token = None
+            self.__auth_headers = None if self.token is None else {**BASE_HEADERS, "authorization": f"Bearer {self.token}"}
+            self.__token_issued_at = time.monotonic()
 
     async def is_everything_okay(self) -> bool:
-        response = await self.__send_graphql_query("{ status { isEverythingOkay } }", {}, False)
+        response = await self.__send_graphql_query(STATUS_GRAPHQL_QUERY, EMPTY_VARIABLES, False)
 
         return response["data"]["status"]["isEverythingOkay"]
 
-    async def get_devices(self) -> list[Device]:
-        response = await self.__send_graphql_query(DEVICES_GRAPHQL_QUERY, { "forceUpdate": True }, True)
+    async def get_devices(self, force_update: bool = True) -> list[Device]:
+        # Once the static metadata is known, routine polls only need the mutable state fields
+        if self.__device_metadata_cache:
+            devices = await self.__poll_device_state(force_update)
+            if devices is not None:
+                self.__devices_cache = (
+                    time.monotonic(),
+                    {device.junction_id: device for device in devices}
+                )
+                return devices
+
+        response = await self.__send_graphql_query(
+            DEVICES_GRAPHQL_QUERY,
+            FORCE_UPDATE_VARIABLES if force_update else NO_FORCE_UPDATE_VARIABLES,
+            True
+        )
 
         device_dicts: list[dict[str, Any]] | None = response.get("data", {}).get("devices")
         if device_dicts is None:
             raise AOSmithUnknownException("Failed to retrieve devices")
 
-        compatible_device_dicts = list(filter(device_is_compatible, device_dicts))
+        devices = [
+            map_device_dict_to_device(device_dict)
+            for device_dict in device_dicts
+            if device_is_compatible(device_dict)
+        ]
+        device_index = {device.junction_id: device for device in devices}
+        self.__device_metadata_cache = device_index
+        self.__devices_cache = (time.monotonic(), device_index)
+        return devices
+
+    async def __poll_device_state(self, force_update: bool) -> list[Device] | None:
+        """Fetch only the mutable device state and merge it with cached static metadata.
+
+        Returns None when a device without cached metadata shows up, in which case the caller
+        falls back to the full query.
+        """
+        response = await self.__send_graphql_query(
+            DEVICES_STATE_GRAPHQL_QUERY,
+            FORCE_UPDATE_VARIABLES if force_update else NO_FORCE_UPDATE_VARIABLES,
+            True
+        )
 
-        return list(map(map_device_dict_to_device, compatible_device_dicts))
+        device_dicts: list[dict[str, Any]] | None = response.get("data", {}).get("devices")
+        if device_dicts is None:
+            raise AOSmithUnknownException("Failed to retrieve devices")
+
+        devices = []
+        for device_dict in device_dicts:
+            if not device_is_compatible(device_dict):
+                continue
+
+            cached_device = self.__device_metadata_cache.get(device_dict.get("junctionId"))
+            if cached_device is None:
+                return None
+
+            try:
+                status = map_device_data_to_device_status(device_dict["data"])
+            except KeyError as err:
+                raise AOSmithUnknownException("Missing required data keys") from err
+            except TypeError as err:
+                raise AOSmithUnknownException("Missing required keys") from err
+
+            devices.append(dataclasses.replace(cached_device, status=status))
+
+        return devices
 
     async def __get_device_by_junction_id(self, junction_id: str) -> Device:
-        devices = await self.get_devices()
+        # Reuse a recently fetched device index so that back-to-back updates don't each refetch every device
+        if self.__devices_cache is not None and time.monotonic() - self.__devices_cache[0] < DEVICES_CACHE_TTL:
+            device_index = self.__devices_cache[1]
+        else:
+            # Validation doesn't need a server-side device refresh, so skip the forced update
+            await self.get_devices(force_update=False)
+            device_index = self.__devices_cache[1]
 
-        device = next(filter(lambda device: device.junction_id == junction_id, devices), None)
+        device = device_index.get(junction_id)
         if device is None:
             raise AOSmithUnknownException("Device not found")
 
         return device
 
     async def __get_device_basic_info_by_junction_id(self, junction_id: str) -> DeviceBasicInfo:
-        response = await self.__send_graphql_query(DEVICES_BASIC_INFO_GRAPHQL_QUERY, { "forceUpdate": True }, True)
+        device_basic_info = self.__device_basic_info_cache.get(junction_id)
+        if device_basic_info is not None:
+            return device_basic_info
+
+        # Basic info is static metadata - no need for a forced server-side refresh
+        response = await self.__send_graphql_query(DEVICES_BASIC_INFO_GRAPHQL_QUERY, NO_FORCE_UPDATE_VARIABLES, True)
 
         device_basic_info_dicts = response.get("data", {}).get("devices", None)
         if device_basic_info_dicts is None:
             raise AOSmithUnknownException("Failed to retrieve devices")
 
-        device_basic_infos = list(map(map_device_basic_info_dict_to_device_basic_info, device_basic_info_dicts))
+        self.__device_basic_info_cache = {
+            device_basic_info.junction_id: device_basic_info
+            for device_basic_info in (
+                map_device_basic_info_dict_to_device_basic_info(device_basic_info_dict)
+                for device_basic_info_dict in device_basic_info_dicts
+            )
+        }
 
-        device_basic_info = next(filter(lambda device_basic_info: device_basic_info.junction_id == junction_id, device_basic_infos), None)
+        device_basic_info = self.__device_basic_info_cache.get(junction_id)
         if device_basic_info is None:
             raise AOSmithUnknownException("Device not found")
 
@@ -338,7 +559,7 @@ class AOSmithAPIClient:
             raise AOSmithInvalidParametersException("Setpoint is above the maximum")
 
         response = await self.__send_graphql_query(
-            "mutation updateSetpoint($junctionId: String!, $value: Int!) { updateSetpoint(junctionId: $junctionId, value: $value) }",
+            UPDATE_SETPOINT_GRAPHQL_MUTATION,
             {
                 "junctionId": junction_id,
                 "value": setpoint
@@ -349,6 +570,9 @@ class AOSmithAPIClient:
         if response.get("data", {}).get("updateSetpoint") is not True:
             raise AOSmithUnknownException("Failed to update setpoint")
 
+        # The cached device list no longer reflects the device state
+        self.__devices_cache = None
+
     async def __get_energy_use_data_by_dsn(self, dsn: str, device_type: str) -> EnergyUseData:
         try:
             response = await self.__send_graphql_query(
@@ -368,23 +592,36 @@ class AOSmithAPIClient:
 
         return map_energy_use_data_dict_to_energy_use_data(energy_use_data_dict)
 
-    async def get_energy_use_data(self, junction_id: str) -> EnergyUseData:
-        device_basic_info = await self.__get_device_basic_info_by_junction_id(junction_id)
-        return await self.__get_energy_use_data_by_dsn(device_basic_info.dsn, device_basic_info.device_type)
+    async def get_energy_use_data(
+        self,
+        junction_id: str,
+        *,
+        dsn: str | None = None,
+        device_type: str | None = None
+    ) -> EnergyUseData:
+        # Callers that already know the device's dsn and deviceType can skip the basic info round trip
+        if dsn is None or device_type is None:
+            device_basic_info = await self.__get_device_basic_info_by_junction_id(junction_id)
+            dsn = device_basic_info.dsn
+            device_type = device_basic_info.device_type
+
+        return await self.__get_energy_use_data_by_dsn(dsn, device_type)
 
     async def update_mode(self, junction_id: str, mode: OperationMode, days: int | None = None) -> None:
+        # A days value outside 1-100 is invalid for every device, so reject it before any network I/O
+        if days is not None and (days <= 0 or days > 100):
+            raise AOSmithInvalidParametersException("Invalid days selection")
+
         device = await self.__get_device_by_junction_id(junction_id)
 
         # check if mode is supported
-        desired_mode = next(filter(lambda device_mode: device_mode.mode == mode, device.supported_modes), None)
+        desired_mode = next((device_mode for device_mode in device.supported_modes if device_mode.mode == mode), None)
         if desired_mode is None:
             raise AOSmithInvalidParametersException("Mode not supported by this device")
 
         if desired_mode.has_day_selection:
             if days is None:
                 days = 100
-            elif days <= 0 or days > 100:
-                raise AOSmithInvalidParametersException("Invalid days selection")
         elif days is not None:
             raise AOSmithInvalidParametersException("Days not supported for this operation mode")
 
@@ -393,7 +630,7 @@ class AOSmithAPIClient:
             mode_payload["days"] = days
 
         response = await self.__send_graphql_query(
-            "mutation updateMode($junctionId: String!, $mode: ModeInput!) { updateMode(junctionId: $junctionId, mode: $mode) }",
+            UPDATE_MODE_GRAPHQL_MUTATION,
             {
                 "junctionId": junction_id,
                 "mode": mode_payload
@@ -404,30 +641,117 @@ class AOSmithAPIClient:
         if response.get("data", {}).get("updateMode") is not True:
             raise AOSmithUnknownException("Failed to update mode")
 
-    async def get_all_device_info(self) -> dict[str, Any]:
-        all_device_data_response = await self.__send_graphql_query(ALL_DEVICE_DATA_GRAPHQL_QUERY, { "forceUpdate": True }, True)
-        all_device_data = all_device_data_response.get("data", {}).get("devices", [])
+        # The cached device list no longer reflects the device state
+        self.__devices_cache = None
 
-        energy_use_data_by_junction_id = {}
+    @staticmethod
+    def __extract_energy_use_device_keys(all_device_data: list[dict[str, Any]]) -> list[tuple[str, str, str]]:
+        # One malformed device entry shouldn't abort energy data for every device, so skip and
+        # log anything missing the keys the energy use query needs
+        device_keys = []
         for device in all_device_data:
-            try:
-                response = await self.__send_graphql_query(
-                    ENERGY_USE_DATA_GRAPHQL_QUERY,
-                    {
-                        "dsn": device["dsn"],
-                        "deviceType": device["deviceType"]
-                    },
-                    True
+            junction_id = device.get("junctionId")
+            dsn = device.get("dsn")
+            device_type = device.get("deviceType")
+            if junction_id is None or dsn is None or device_type is None:
+                logger.warning(
+                    "Skipping device with missing junctionId, dsn, or deviceType in energy use query: %s",
+                    junction_id
                 )
+                continue
+            device_keys.append((junction_id, dsn, device_type))
+        return device_keys
 
-                energy_use_data_by_junction_id[device["junctionId"]] = response.get("data", {}).get("getEnergyUseData")
-            except Exception as err:
-                logger.exception("Failed to get energy use data", exc_info=err)
+    async def __get_energy_use_data_batched(self, all_device_data: list[dict[str, Any]]) -> dict[str, Any]:
+        device_keys = self.__extract_energy_use_device_keys(all_device_data)
+        if len(device_keys) == 0:
+            return {}
+
+        query = build_batched_energy_use_data_graphql_query(len(device_keys))
+
+        variables = {}
+        for index, (junction_id, dsn, device_type) in enumerate(device_keys):
+            variables[f"dsn{index}"] = dsn
+            variables[f"deviceType{index}"] = device_type
+
+        # The batched attempt is speculative - the per-device fallback handles failures,
+        # so don't spend the retry loop on it
+        response = await self.__send_graphql_query(query, variables, True, retries=False)
+        data = response.get("data", {})
+
+        return {
+            junction_id: data.get(f"device{index}")
+            for index, (junction_id, dsn, device_type) in enumerate(device_keys)
+        }
+
+    async def __get_energy_use_data_per_device(self, all_device_data: list[dict[str, Any]]) -> dict[str, Any]:
+        device_keys = self.__extract_energy_use_device_keys(all_device_data)
+
+        # The energy use queries are independent of each other, so send them concurrently
+        tasks = [
+            self.__send_graphql_query(
+                ENERGY_USE_DATA_GRAPHQL_QUERY,
+                {
+                    "dsn": dsn,
+                    "deviceType": device_type
+                },
+                True
+            )
+            for junction_id, dsn, device_type in device_keys
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        energy_use_data_by_junction_id = {}
+        for (junction_id, dsn, device_type), result in zip(device_keys, results):
+            if isinstance(result, AOSmithEnergyUsageDataUnavailableException):
+                # Routine for newly installed devices - there is just no data yet
+                logger.debug("Energy use data is unavailable for device %s", junction_id)
+            elif isinstance(result, Exception):
+                logger.exception("Failed to get energy use data", exc_info=result)
+            else:
+                energy_use_data_by_junction_id[junction_id] = result.get("data", {}).get("getEnergyUseData")
+
+        return energy_use_data_by_junction_id
+
+    async def get_all_device_info(self, include_alerts: bool = True) -> dict[str, Any]:
+        # The alert blocks dominate the response size - callers that don't need them can request
+        # the slimmer query variant
+        query = ALL_DEVICE_DATA_GRAPHQL_QUERY if include_alerts else ALL_DEVICE_DATA_NO_ALERTS_GRAPHQL_QUERY
+
+        # This query also primes the access token, so the concurrent energy use queries below don't all race into a login
+        all_device_data_response = await self.__send_graphql_query(query, FORCE_UPDATE_VARIABLES, True)
+        all_device_data = all_device_data_response.get("data", {}).get("devices", [])
+
+        energy_use_data_by_junction_id = {}
+        if len(all_device_data) > 0:
+            if self.__energy_use_batching_failed:
+                energy_use_data_by_junction_id = await self.__get_energy_use_data_per_device(all_device_data)
+            else:
+                try:
+                    energy_use_data_by_junction_id = await self.__get_energy_use_data_batched(all_device_data)
+                except Exception as err:
+                    # A single data-less device fails the whole batch (the API reports
+                    # "No data to display at this time."), so remember the failure and
+                    # stay on the per-device path from now on
+                    self.__energy_use_batching_failed = True
+                    if isinstance(err, AOSmithEnergyUsageDataUnavailableException):
+                        logger.debug("A device has no energy use data - falling back to per-device queries")
+                    else:
+                        logger.warning("Batched energy use query failed - falling back to per-device queries", exc_info=err)
+                    energy_use_data_by_junction_id = await self.__get_energy_use_data_per_device(all_device_data)
 
         return {
             "devices": all_device_data,
             "energy_use_data": energy_use_data_by_junction_id
         }
 
+    async def __aenter__(self) -> "AOSmithAPIClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
     async def close(self):
-        await self.session.close()
+        # Only close sessions we created - a caller-provided session stays the caller's responsibility
+        if self.__owns_session:
+            await self.session.close()
@@ -11,13 +11,13 @@ class OperationMode(Enum):
     ELECTRIC = "electric"
     VACATION = "vacation"
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SupportedOperationModeInfo:
     mode: OperationMode
     original_name: str
     has_day_selection: bool
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DeviceStatus:
     firmware_version: str
     is_online: bool
@@ -29,7 +29,7 @@ class DeviceStatus:
     temperature_setpoint_maximum: int
     hot_water_status: int | None
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Device:
     brand: str
     model: str
@@ -42,7 +42,7 @@ class Device:
     supported_modes: list[SupportedOperationModeInfo]
     status: DeviceStatus
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DeviceBasicInfo:
     brand: str
     model: str
@@ -52,12 +52,12 @@ class DeviceBasicInfo:
     name: str
     serial: str
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EnergyUseHistoryEntry:
     date: str
     energy_use_kwh: float
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EnergyUseData:
     lifetime_kwh: float
     history: list[EnergyUseHistoryEntry]
\ No newline at end of file
@@ -1,4 +1,45 @@
-DEVICES_GRAPHQL_QUERY = """
+import re
+
+def minify_graphql_query(query: str) -> str:
+    """Collapse whitespace runs so each query is encoded and sent in its compact form"""
+    # Braces, colons and commas are GraphQL punctuators, so the spaces around them are dead weight too
+    return re.sub(r"\s*([{}:,()])\s*", r"\1", re.sub(r"\s+", " ", query)).strip()
+
+LOGIN_GRAPHQL_QUERY = minify_graphql_query("""
+query login($passcode: String) {
+    login(passcode: $passcode) {
+        user {
+            tokens {
+                accessToken
+                idToken
+                refreshToken
+            }
+        }
+    }
+}
+""")
+
+STATUS_GRAPHQL_QUERY = minify_graphql_query("""
+query status {
+    status {
+        isEverythingOkay
+    }
+}
+""")
+
+UPDATE_SETPOINT_GRAPHQL_MUTATION = minify_graphql_query("""
+mutation updateSetpoint($junctionId: String!, $value: Int!) {
+    updateSetpoint(junctionId: $junctionId, value: $value)
+}
+""")
+
+UPDATE_MODE_GRAPHQL_MUTATION = minify_graphql_query("""
+mutation updateMode($junctionId: String!, $mode: ModeInput!) {
+    updateMode(junctionId: $junctionId, mode: $mode)
+}
+""")
+
+DEVICES_GRAPHQL_QUERY = minify_graphql_query("""
 query devices($forceUpdate: Boolean, $junctionIds: [String]) {
     devices(forceUpdate: $forceUpdate, junctionIds: $junctionIds) {
         brand
@@ -37,10 +78,41 @@ query devices($forceUpdate: Boolean, $junctionIds: [String]) {
         }
     }
 }
-"""
+""")
 
-DEVICES_BASIC_INFO_GRAPHQL_QUERY = """
-query devices($forceUpdate: Boolean, $junctionIds: [String]) {
+# Slim polling variant of the devices query - it selects only the fields that change between
+# polls; the static metadata (brand, model, install location, supported modes, ...) is reused
+# from the most recent full fetch
+DEVICES_STATE_GRAPHQL_QUERY = minify_graphql_query("""
+query devicesState($forceUpdate: Boolean, $junctionIds: [String]) {
+    devices(forceUpdate: $forceUpdate, junctionIds: $junctionIds) {
+        junctionId
+        data {
+            __typename
+            temperatureSetpoint
+            temperatureSetpointPending
+            temperatureSetpointPrevious
+            temperatureSetpointMaximum
+            isOnline
+            ... on NextGenHeatPump {
+                firmwareVersion
+                hotWaterStatus
+                mode
+                modePending
+            }
+            ... on RE3Connected {
+                firmwareVersion
+                hotWaterStatus
+                mode
+                modePending
+            }
+        }
+    }
+}
+""")
+
+DEVICES_BASIC_INFO_GRAPHQL_QUERY = minify_graphql_query("""
+query devicesBasicInfo($forceUpdate: Boolean, $junctionIds: [String]) {
     devices(forceUpdate: $forceUpdate, junctionIds: $junctionIds) {
         brand
         model
@@ -51,9 +123,9 @@ query devices($forceUpdate: Boolean, $junctionIds: [String]) {
         serial
     }
 }
-"""
+""")
 
-ENERGY_USE_DATA_GRAPHQL_QUERY = """
+ENERGY_USE_DATA_GRAPHQL_QUERY = minify_graphql_query("""
 query getEnergyUseData($dsn: String!, $deviceType: DeviceType!) {
     getEnergyUseData(dsn: $dsn, deviceType: $deviceType) {
         average
@@ -65,11 +137,107 @@ query getEnergyUseData($dsn: String!, $deviceType: DeviceType!) {
         startDate
     }
 }
+""")
+
+# Prefix shared by every batched energy use query, so callers can recognize one by its text
+BATCHED_ENERGY_USE_DATA_QUERY_PREFIX = "query getEnergyUseDataBatch("
+
+def build_batched_energy_use_data_graphql_query(device_count: int) -> str:
+    """Build a single query fetching energy use data for multiple devices via aliased root fields"""
+    variable_definitions = ", ".join(
+        f"$dsn{index}: String!, $deviceType{index}: DeviceType!" for index in range(device_count)
+    )
+
+    aliased_fields = "\n".join(
+        f"""    device{index}: getEnergyUseData(dsn: $dsn{index}, deviceType: $deviceType{index}) {{
+        average
+        graphData {{
+            date
+            kwh
+        }}
+        lifetimeKwh
+        startDate
+    }}"""
+        for index in range(device_count)
+    )
+
+    return minify_graphql_query(f"""
+query getEnergyUseDataBatch({variable_definitions}) {{
+{aliased_fields}
+}}
+""")
+
+# Shared selection sets for the all-device-data query. GraphQL named fragments would be the
+# on-the-wire equivalent, but they need the server's type names, which the API doesn't publish -
+# so the deduplication happens here in the source instead
+ALERT_INFORMATION_FIELDS = """
+        information {
+          en {
+            advancedText
+            advancedTitle
+            text
+            title
+          }
+          fr {
+            advancedText
+            advancedTitle
+            text
+            title
+          }
+        }
 """
 
-ALL_DEVICE_DATA_GRAPHQL_QUERY = """
-query devices($forceUpdate: Boolean, $junctionIds: [String]) {
-  devices(forceUpdate: $forceUpdate, junctionIds: $junctionIds) {
+TIME_OF_USE_FIELDS = """
+        timeOfUseData {
+          appliedOn
+          energyUsePreference
+          tariffCode
+          tariffID
+          utility
+          utilityID
+        }
+"""
+
+CONSUMER_SCHEDULE_FIELDS = """
+        consumerScheduleData {
+          appliedOn
+          schedules {
+            days
+            id
+            name
+            times {
+              time
+              meridiem
+            }
+          }
+        }
+"""
+
+# The alert blocks are the heaviest part of the all-device-data query (en+fr translations for
+# every active and historical alert), so they are spliced in separately - callers that don't
+# need alerts can use the variant without them
+ALL_DEVICE_DATA_ALERT_FIELDS = """
+      activeAlerts {
+        active
+        code
+%(alert_information)s
+        shouldRestrictChanges
+        shouldShowSoftReset
+        timestamp
+        type
+      }
+      alertHistory {
+        active
+        code
+%(alert_information)s
+        shouldRestrictChanges
+        shouldShowSoftReset
+        timestamp
+        type
+      }
+""" % {"alert_information": ALERT_INFORMATION_FIELDS}
+
+ALL_DEVICE_DATA_ALERT_SETTINGS_FIELDS = """
     alertSettings {
       faultCode {
         major {
@@ -98,6 +266,12 @@ query devices($forceUpdate: Boolean, $junctionIds: [String]) {
         }
       }
     }
+"""
+
+ALL_DEVICE_DATA_GRAPHQL_QUERY_TEMPLATE = """
+query devicesAll($forceUpdate: Boolean, $junctionIds: [String]) {
+  devices(forceUpdate: $forceUpdate, junctionIds: $junctionIds) {
+%(alert_settings)s
     brand
     deviceType
     dsn
@@ -142,50 +316,7 @@ query devices($forceUpdate: Boolean, $junctionIds: [String]) {
 
     data {
       __typename
-      activeAlerts {
-        active
-        code
-        information {
-          en {
-            advancedText
-            advancedTitle
-            text
-            title
-          }
-          fr {
-            advancedText
-            advancedTitle
-            text
-            title
-          }
-        }
-        shouldRestrictChanges
-        shouldShowSoftReset
-        timestamp
-        type
-      }
-      alertHistory {
-        active
-        code
-        information {
-          en {
-            advancedText
-            advancedTitle
-            text
-            title
-          }
-          fr {
-            advancedText
-            advancedTitle
-            text
-            title
-          }
-        }
-        shouldRestrictChanges
-        shouldShowSoftReset
-        timestamp
-        type
-      }
+%(alerts)s
       isOnline
       isWifi
       lastUpdate
@@ -214,14 +345,7 @@ query devices($forceUpdate: Boolean, $junctionIds: [String]) {
         canEditTimeOfUse
         hotWaterStatus
 
-        timeOfUseData {
-          appliedOn
-          energyUsePreference
-          tariffCode
-          tariffID
-          utility
-          utilityID
-        }
+%(time_of_use)s
       }
 
       ... on CommercialGas {
@@ -265,27 +389,9 @@ query devices($forceUpdate: Boolean, $junctionIds: [String]) {
         isAltMcu
         canEditTimeOfUse
 
-        timeOfUseData {
-          appliedOn
-          energyUsePreference
-          tariffCode
-          tariffID
-          utility
-          utilityID
-        }
+%(time_of_use)s
 
-        consumerScheduleData {
-          appliedOn
-          schedules {
-            days
-            id
-            name
-            times {
-              time
-              meridiem
-            }
-          }
-        }
+%(consumer_schedules)s
       }
 
       ... on NextGenHeatPump {
@@ -302,27 +408,9 @@ query devices($forceUpdate: Boolean, $junctionIds: [String]) {
         isLowes
         canEditTimeOfUse
 
-        timeOfUseData {
-          appliedOn
-          energyUsePreference
-          tariffCode
-          tariffID
-          utility
-          utilityID
-        }
+%(time_of_use)s
 
-        consumerScheduleData {
-          appliedOn
-          schedules {
-            days
-            id
-            name
-            times {
-              time
-              meridiem
-            }
-          }
-        }
+%(consumer_schedules)s
       }
 
       ... on RE3Premium {
@@ -339,27 +427,9 @@ query devices($forceUpdate: Boolean, $junctionIds: [String]) {
         canEditTimeOfUse
         hotWaterPlusLevel
 
-        timeOfUseData {
-          appliedOn
-          energyUsePreference
-          tariffCode
-          tariffID
-          utility
-          utilityID
-        }
+%(time_of_use)s
 
-        consumerScheduleData {
-          appliedOn
-          schedules {
-            days
-            id
-            name
-            times {
-              time
-              meridiem
-            }
-          }
-        }
+%(consumer_schedules)s
       }
 
       ... on Mustang {
@@ -386,3 +456,17 @@ query devices($forceUpdate: Boolean, $junctionIds: [String]) {
   }
 }
 """
+
+ALL_DEVICE_DATA_GRAPHQL_QUERY = minify_graphql_query(ALL_DEVICE_DATA_GRAPHQL_QUERY_TEMPLATE % {
+    "alert_settings": ALL_DEVICE_DATA_ALERT_SETTINGS_FIELDS,
+    "alerts": ALL_DEVICE_DATA_ALERT_FIELDS,
+    "time_of_use": TIME_OF_USE_FIELDS,
+    "consumer_schedules": CONSUMER_SCHEDULE_FIELDS
+})
+
+ALL_DEVICE_DATA_NO_ALERTS_GRAPHQL_QUERY = minify_graphql_query(ALL_DEVICE_DATA_GRAPHQL_QUERY_TEMPLATE % {
+    "alert_settings": "",
+    "alerts": "",
+    "time_of_use": TIME_OF_USE_FIELDS,
+    "consumer_schedules": CONSUMER_SCHEDULE_FIELDS
+})